@@ -261,11 +261,16 @@ class Defects(collections.abc.MutableSequence):
         table = lsst.afw.table.BaseCatalog(schema)
         table.resize(len(self._defects))
 
-        for i, defect in enumerate(self._defects):
-            box = defect.getBBox()
-            # Correct for the FITS 1-based offset
-            table[i][x] = box.getCenterX() + 1.0
-            table[i][y] = box.getCenterY() + 1.0
+        # Numeric scalar columns can be filled whole; only the string and
+        # array columns need to be set record by record
+        bboxes = [defect.getBBox() for defect in self._defects]
+        # Correct for the FITS 1-based offset
+        table[x] = np.array([box.getCenterX() for box in bboxes], dtype=np.float64) + 1.0
+        table[y] = np.array([box.getCenterY() for box in bboxes], dtype=np.float64) + 1.0
+        table[rotang] = np.zeros(len(bboxes), dtype=np.float64)
+        table[component] = np.arange(len(bboxes), dtype=np.int32)
+
+        for record, box in zip(table, bboxes):
             width = box.getWidth()
             height = box.getHeight()
 
@@ -274,10 +279,8 @@ class Defects(collections.abc.MutableSequence):
                 shapeType = "POINT"
             else:
                 shapeType = "BOX"
-            table[i][shape] = shapeType
-            table[i][r] = np.array([width, height], dtype=np.float64)
-            table[i][rotang] = 0.0
-            table[i][component] = i
+            record[shape] = shapeType
+            record[r] = np.array([width, height], dtype=np.float64)
 
         # Set some metadata in the table (force OBSTYPE to exist)
         metadata = copy.copy(self.getMetadata())
@@ -344,12 +347,12 @@ class Defects(collections.abc.MutableSequence):
         table = lsst.afw.table.BaseCatalog(schema)
         table.resize(len(self._defects))
 
-        for i, defect in enumerate(self._defects):
-            box = defect.getBBox()
-            table[i][x] = box.getBeginX()
-            table[i][y] = box.getBeginY()
-            table[i][width] = box.getWidth()
-            table[i][height] = box.getHeight()
+        # Fill whole columns at once rather than setting each record
+        bboxes = [defect.getBBox() for defect in self._defects]
+        table[x] = np.array([box.getBeginX() for box in bboxes], dtype=np.int32)
+        table[y] = np.array([box.getBeginY() for box in bboxes], dtype=np.int32)
+        table[width] = np.array([box.getWidth() for box in bboxes], dtype=np.int32)
+        table[height] = np.array([box.getHeight() for box in bboxes], dtype=np.int32)
 
         # Set some metadata in the table (force OBSTYPE to exist)
         metadata = copy.copy(self.getMetadata())
@@ -476,10 +479,9 @@ class Defects(collections.abc.MutableSequence):
         else:
             raise ValueError("Unsupported schema for defects extraction")
 
-        for r in table:
-            record = r.extract("*")
-
-            if isFitsRegion:
+        if isFitsRegion:
+            for r in table:
+                record = r.extract("*")
                 # Coordinates can be arrays (some shapes in the standard
                 # require this)
                 # Correct for FITS 1-based origin
@@ -516,12 +518,15 @@ class Defects(collections.abc.MutableSequence):
                     log.warning("Defect lists can only be defined using BOX or POINT not %s", shape)
                     continue
 
-            elif "x0" in record and "y0" in record and "width" in record and "height" in record:
-                # This is a classic LSST-style defect table
-                box = lsst.geom.Box2I(lsst.geom.Point2I(record["x0"], record["y0"]),
-                                      lsst.geom.Extent2I(record["width"], record["height"]))
-
-            defectList.append(box)
+                defectList.append(box)
+        else:
+            # Classic tables hold one scalar per column and row, so read
+            # whole columns rather than extracting every record
+            columns = table if table.isContiguous() else table.copy(deep=True)
+            for x0, y0, width, height in zip(columns["x0"].tolist(), columns["y0"].tolist(),
+                                             columns["width"].tolist(), columns["height"].tolist()):
+                defectList.append(lsst.geom.Box2I(lsst.geom.Point2I(x0, y0),
+                                                  lsst.geom.Extent2I(width, height)))
 
         defects = cls(defectList)
         defects.setMetadata(table.getMetadata())
@@ -439,10 +439,12 @@ into your debug.py file and run measAlgTasks.py with the @c --debug flag.
         # Subtract the local background from the smoothed image. Since we
         # never use the smoothed again we don't need to worry about adding
         # it back in.
+        # Only evaluate the background model over the region we subtract it
+        # from, rather than building a full-frame image and taking a view.
         bg = self.tempLocalBackground.fitBackground(exposure.getMaskedImage())
-        bgImage = bg.getImageF(self.tempLocalBackground.config.algorithm,
+        bgImage = bg.getImageF(middle.getBBox(), self.tempLocalBackground.config.algorithm,
                                self.tempLocalBackground.config.undersampleStyle)
-        middle -= bgImage.Factory(bgImage, middle.getBBox())
+        middle -= bgImage
         thresholdPos = self.makeThreshold(middle, "positive")
         thresholdNeg = self.makeThreshold(middle, "negative")
         if self.config.thresholdPolarity != "negative":
@@ -23,6 +23,8 @@
 
 __all__ = ["IndexerRegistry"]
 
+import functools
+
 from lsst.pex.config import Config, makeRegistry, Field
 from .htmIndexer import HtmIndexer
 
@@ -40,10 +42,20 @@ class HtmIndexerConfig(Config):
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _getHtmIndexer(depth):
+    """Return the process-wide HtmIndexer for a given depth
+
+    HtmIndexer holds no mutable state, so one instance per depth can be
+    shared by every reference object loader and ingester.
+    """
+    return HtmIndexer(depth=depth)
+
+
 def makeHtmIndexer(config):
     """Make an HtmIndexer
     """
-    return HtmIndexer(depth=config.depth)
+    return _getHtmIndexer(config.depth)
 
 
 makeHtmIndexer.ConfigClass = HtmIndexerConfig
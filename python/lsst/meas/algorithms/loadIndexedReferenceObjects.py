@@ -23,6 +23,8 @@
 
 __all__ = ["LoadIndexedReferenceObjectsConfig", "LoadIndexedReferenceObjectsTask"]
 
+import numpy as np
+
 from .loadReferenceObjects import hasNanojanskyFluxUnits, convertToNanojansky, getFormatVersionFromRefCat
 from lsst.meas.algorithms import getRefFluxField, LoadReferenceObjectsTask, LoadReferenceObjectsConfig
 import lsst.afw.table as afwTable
@@ -60,14 +62,20 @@ class LoadIndexedReferenceObjectsTask(LoadReferenceObjectsTask):
         # change the path where the shards are found.
         self.ref_dataset_name = self.config.ref_dataset_name
         self.butler = butler
+        # Empty catalog carrying the reference catalog schema and metadata;
+        # read on first use and copied for each load
+        self._masterSchemaCat = None
 
     @pipeBase.timeMethod
     def loadSkyCircle(self, ctrCoord, radius, filterName=None, epoch=None, centroids=False):
         shardIdList, isOnBoundaryList = self.indexer.getShardIds(ctrCoord, radius)
         shards = self.getShards(shardIdList)
-        refCat = self.butler.get('ref_cat',
-                                 dataId=self.indexer.makeDataId('master_schema', self.ref_dataset_name),
-                                 immediate=True)
+        if self._masterSchemaCat is None:
+            self._masterSchemaCat = self.butler.get('ref_cat',
+                                                    dataId=self.indexer.makeDataId('master_schema',
+                                                                                   self.ref_dataset_name),
+                                                    immediate=True)
+        refCat = self._masterSchemaCat.copy(deep=True)
 
         # load the catalog, one shard at a time
         for shard, isOnBoundary in zip(shards, isOnBoundaryList):
@@ -166,8 +174,14 @@ class LoadIndexedReferenceObjectsTask(LoadReferenceObjectsTask):
         catalog : `lsst.afw.table.SimpleCatalog`
             Catalog containing objects that fall in the circular aperture.
         """
-        tempCat = type(refCat)(refCat.schema)
-        for record in refCat:
-            if record.getCoord().separation(ctrCoord) < radius:
-                tempCat.append(record)
-        return tempCat
+        if not refCat.isContiguous():
+            refCat = refCat.copy(deep=True)
+        ra = refCat["coord_ra"]
+        dec = refCat["coord_dec"]
+        ctrRa = ctrCoord.getLongitude().asRadians()
+        ctrDec = ctrCoord.getLatitude().asRadians()
+        # Haversine formula, which is well-conditioned for small separations
+        hav = (np.sin(0.5*(dec - ctrDec))**2 +
+               np.cos(dec)*np.cos(ctrDec)*np.sin(0.5*(ra - ctrRa))**2)
+        separation = 2.0*np.arcsin(np.sqrt(np.clip(hav, 0.0, 1.0)))
+        return refCat[separation < radius.asRadians()]
@@ -953,7 +953,8 @@ class LoadReferenceObjectsTask(pipeBase.Task, metaclass=abc.ABCMeta):
 
         # make sure catalog is contiguous
         if not refCat.isContiguous():
-            loadRes.refCat = refCat.copy(deep=True)
+            refCat = refCat.copy(deep=True)
+        loadRes.refCat = refCat
 
         return loadRes
 
@@ -1018,13 +1019,15 @@ class LoadReferenceObjectsTask(pipeBase.Task, metaclass=abc.ABCMeta):
         @return a catalog of reference objects in bbox, with centroid and hasCentroid fields set
         """
         afwTable.updateRefCentroids(wcs, refCat)
+        if not refCat.isContiguous():
+            refCat = refCat.copy(deep=True)
         centroidKey = afwTable.Point2DKey(refCat.schema["centroid"])
-        retStarCat = type(refCat)(refCat.table)
-        for star in refCat:
-            point = star.get(centroidKey)
-            if bbox.contains(point):
-                retStarCat.append(star)
-        return retStarCat
+        x = refCat[centroidKey.getX()]
+        y = refCat[centroidKey.getY()]
+        # Box2D.contains is inclusive at the minimum and exclusive at the maximum
+        inBBox = ((x >= bbox.getMinX()) & (x < bbox.getMaxX()) &
+                  (y >= bbox.getMinY()) & (y < bbox.getMaxY()))
+        return refCat[inBBox]
 
     def _addFluxAliases(self, schema):
         """Add aliases for camera filter fluxes to the schema.
@@ -210,11 +210,17 @@ class MeasureApCorrTask(Task):
         doPause = lsstDebug.Info(__name__).doPause
 
         self.log.info("Measuring aperture corrections for %d flux fields" % (len(self.toCorrect),))
-        # First, create a subset of the catalog that contains only selected stars
-        # with non-flagged reference fluxes.
-        subset1 = [record for record in self.sourceSelector.run(catalog, exposure=exposure).sourceCat
-                   if (not record.get(self.refFluxKeys.flag) and
-                       numpy.isfinite(record.get(self.refFluxKeys.flux)))]
+        # First, select the stars with non-flagged reference fluxes.  The source
+        # selector requires a contiguous catalog, so we can work with columns.
+        selected = self.sourceSelector.run(catalog, exposure=exposure).selected
+        refFluxes = catalog[self.refFluxKeys.flux]
+        isGoodRef = numpy.logical_and.reduce([
+            selected,
+            numpy.logical_not(catalog[self.refFluxKeys.flag]),
+            numpy.isfinite(refFluxes),
+        ])
+        xAll = catalog.getX()
+        yAll = catalog.getY()
 
         apCorrMap = ApCorrMap()
 
@@ -225,44 +231,41 @@ class MeasureApCorrTask(Task):
 
             # Create a more restricted subset with only the objects where the to-be-correct flux
             # is not flagged.
-            fluxes = numpy.fromiter((record.get(keys.flux) for record in subset1), float)
+            fluxes = catalog[keys.flux]
             with numpy.errstate(invalid="ignore"):  # suppress NAN warnings
                 isGood = numpy.logical_and.reduce([
-                    numpy.fromiter((not record.get(keys.flag) for record in subset1), bool),
+                    isGoodRef,
+                    numpy.logical_not(catalog[keys.flag]),
                     numpy.isfinite(fluxes),
                     fluxes > 0.0,
                 ])
-            subset2 = [record for record, good in zip(subset1, isGood) if good]
+            # Indices of the good sources in the full catalog
+            indices = numpy.flatnonzero(isGood)
 
             # Check that we have enough data points that we have at least the minimum of degrees of
             # freedom specified in the config.
-            if len(subset2) - 1 < self.config.minDegreesOfFreedom:
+            if len(indices) - 1 < self.config.minDegreesOfFreedom:
                 if name in self.config.allowFailure:
                     self.log.warn("Unable to measure aperture correction for '%s': "
                                   "only %d sources, but require at least %d." %
-                                  (name, len(subset2), self.config.minDegreesOfFreedom+1))
+                                  (name, len(indices), self.config.minDegreesOfFreedom+1))
                     continue
                 raise RuntimeError("Unable to measure aperture correction for required algorithm '%s': "
                                    "only %d sources, but require at least %d." %
-                                   (name, len(subset2), self.config.minDegreesOfFreedom+1))
+                                   (name, len(indices), self.config.minDegreesOfFreedom+1))
 
             # If we don't have enough data points to constrain the fit, reduce the order until we do
             ctrl = self.config.fitConfig.makeControl()
-            while len(subset2) - ctrl.computeSize() < self.config.minDegreesOfFreedom:
+            while len(indices) - ctrl.computeSize() < self.config.minDegreesOfFreedom:
                 if ctrl.orderX > 0:
                     ctrl.orderX -= 1
                 if ctrl.orderY > 0:
                     ctrl.orderY -= 1
 
             # Fill numpy arrays with positions and the ratio of the reference flux to the to-correct flux
-            x = numpy.zeros(len(subset2), dtype=float)
-            y = numpy.zeros(len(subset2), dtype=float)
-            apCorrData = numpy.zeros(len(subset2), dtype=float)
-            indices = numpy.arange(len(subset2), dtype=int)
-            for n, record in enumerate(subset2):
-                x[n] = record.getX()
-                y[n] = record.getY()
-                apCorrData[n] = record.get(self.refFluxKeys.flux)/record.get(keys.flux)
+            x = xAll[indices]
+            y = yAll[indices]
+            apCorrData = refFluxes[indices]/fluxes[indices]
 
             for _i in range(self.config.numIter):
 
@@ -306,7 +309,7 @@ class MeasureApCorrTask(Task):
 
             # Record which sources were used
             for i in indices:
-                subset2[i].set(keys.used, True)
+                catalog[int(i)].set(keys.used, True)
 
         return Struct(
             apCorrMap=apCorrMap,
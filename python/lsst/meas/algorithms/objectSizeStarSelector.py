@@ -421,19 +421,20 @@ class ObjectSizeStarSelectorTask(BaseSourceSelectorTask):
         flux = sourceCat.get(self.config.sourceFluxField)
         fluxErr = sourceCat.get(self.config.sourceFluxField + "Err")
 
-        xx = numpy.empty(len(sourceCat))
-        xy = numpy.empty_like(xx)
-        yy = numpy.empty_like(xx)
-        for i, source in enumerate(sourceCat):
-            Ixx, Ixy, Iyy = source.getIxx(), source.getIxy(), source.getIyy()
-            if pixToTanPix:
+        xx = sourceCat.getIxx()
+        xy = sourceCat.getIxy()
+        yy = sourceCat.getIyy()
+        if pixToTanPix:
+            # The linearized transform varies across the detector, so the
+            # moments have to be transformed one source at a time.  Work on
+            # copies, as the columns are views into the catalog.
+            xx, xy, yy = xx.copy(), xy.copy(), yy.copy()
+            for i, source in enumerate(sourceCat):
                 p = lsst.geom.Point2D(source.getX(), source.getY())
                 linTransform = afwGeom.linearizeTransform(pixToTanPix, p).getLinear()
-                m = afwGeom.Quadrupole(Ixx, Iyy, Ixy)
+                m = afwGeom.Quadrupole(xx[i], yy[i], xy[i])
                 m.transform(linTransform)
-                Ixx, Iyy, Ixy = m.getIxx(), m.getIyy(), m.getIxy()
-
-            xx[i], xy[i], yy[i] = Ixx, Ixy, Iyy
+                xx[i], xy[i], yy[i] = m.getIxx(), m.getIxy(), m.getIyy()
 
         width = numpy.sqrt(0.5*(xx + yy))
         with numpy.errstate(invalid="ignore"):  # suppress NAN warnings
@@ -538,14 +539,16 @@ class ObjectSizeStarSelectorTask(BaseSourceSelectorTask):
 
         if display and displayExposure:
             mi = exposure.getMaskedImage()
+            xDisp = sourceCat.getX() - mi.getX0()
+            yDisp = sourceCat.getY() - mi.getY0()
             with disp.Buffering():
-                for i, source in enumerate(sourceCat):
-                    if good[i]:
+                for xc, yc, isGood in zip(xDisp, yDisp, good):
+                    if isGood:
                         ctype = afwDisplay.GREEN  # star candidate
                     else:
                         ctype = afwDisplay.RED  # not star
 
-                    disp.dot("+", source.getX() - mi.getX0(), source.getY() - mi.getY0(), ctype=ctype)
+                    disp.dot("+", xc, yc, ctype=ctype)
 
         # stellar only applies to good==True objects
         mask = good == True  # noqa (numpy bool comparison): E712
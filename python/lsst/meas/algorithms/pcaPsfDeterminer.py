@@ -424,25 +424,27 @@ class PcaPsfDeterminerTask(BasePsfDeterminerTask):
 
             residuals = list()
             candidates = list()
+            # Fetch the kernel, its size and its spatial functions (which are cloned
+            # on every access) once, rather than for every candidate
             kernel = psf.getKernel()
-            noSpatialKernel = psf.getKernel()
+            kWidth, kHeight = kernel.getWidth(), kernel.getHeight()
+            spatialFunctions = [kernel.getSpatialFunction(k) for k in range(kernel.getNKernelParameters())]
             for cell in psfCellSet.getCellList():
                 for cand in cell.begin(False):
                     candCenter = lsst.geom.PointD(cand.getXCenter(), cand.getYCenter())
                     try:
-                        im = cand.getMaskedImage(kernel.getWidth(), kernel.getHeight())
+                        im = cand.getMaskedImage(kWidth, kHeight)
                     except Exception:
                         continue
 
-                    fit = fitKernelParamsToImage(noSpatialKernel, im, candCenter)
+                    fit = fitKernelParamsToImage(kernel, im, candCenter)
                     params = fit[0]
                     kernels = fit[1]
                     amp = 0.0
                     for p, k in zip(params, kernels):
                         amp += p*k.getSum()
 
-                    predict = [kernel.getSpatialFunction(k)(candCenter.getX(), candCenter.getY()) for
-                               k in range(kernel.getNKernelParameters())]
+                    predict = [func(candCenter.getX(), candCenter.getY()) for func in spatialFunctions]
 
                     residuals.append([a/amp - p for a, p in zip(params, predict)])
                     candidates.append(cand)
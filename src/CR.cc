@@ -485,7 +485,9 @@ std::vector<std::shared_ptr<afw::detection::Footprint>> findCosmicRays(
         assert((*sp)->y >= 0);
         assert((*sp)->x0 >= 0);
         assert((*sp)->x1 >= (*sp)->x0);
-        for (std::vector<afw::detection::IdSpan::Ptr>::iterator sp2 = sp + 1; sp2 != end; sp2++) {
+        // the ordering is transitive, so it's sufficient to check each span against its successor
+        std::vector<afw::detection::IdSpan::Ptr>::iterator sp2 = sp + 1;
+        if (sp2 != end) {
             assert((*sp2)->y >= (*sp)->y);
             if ((*sp2)->y == (*sp)->y) {
                 assert((*sp2)->x0 > (*sp)->x1);
@@ -63,6 +63,7 @@ static std::vector<Defect::Ptr> classify_defects(
         int = 0                                   // number of rows in image
 ) {
     std::vector<Defect::Ptr> badList1D;
+    badList1D.reserve(badList.size());  // merging defects can only reduce their number
 
     for (DefectCIter begin = badList.begin(), end = badList.end(), bri = begin; bri != end; ++bri) {
         Defect::Ptr defect = *bri;
@@ -94,8 +95,8 @@ static std::vector<Defect::Ptr> classify_defects(
         int const nbad = x1 - x0 + 1;
         assert(nbad >= 1);
 
-        defect = Defect::Ptr(new Defect(geom::BoxI(geom::Point2I(x0, y), geom::Extent2I(nbad, 1))));
-        badList1D.push_back(defect);
+        badList1D.push_back(
+                std::make_shared<Defect>(geom::BoxI(geom::Point2I(x0, y), geom::Extent2I(nbad, 1))));
 
         if (bri == end) {
             break;
@@ -2079,12 +2080,24 @@ void interpolateOverDefects(MaskedImageT &mimage,                ///< Image to p
         }
 
         bbox = geom::BoxI(min, max);
-        Defect::Ptr ndefect(new Defect(bbox));
+        auto ndefect = std::make_shared<Defect>(bbox);
         ndefect->classify((*ptr)->getPos(), (*ptr)->getType());
         badList.push_back(ndefect);
     }
 
     sort(badList.begin(), badList.end(), Sort_ByX0<Defect>());
+    /*
+     * Bucket the defects by the rows that they touch, so that each row only has to consider
+     * the defects that actually cross it.  The buckets inherit the X0 ordering of badList
+     */
+    std::vector<std::vector<Defect::Ptr>> rowBadList(height);
+    for (DefectCIter ptr = badList.begin(), end = badList.end(); ptr != end; ++ptr) {
+        int const y0 = std::max((*ptr)->getY0(), 0);
+        int const y1 = std::min((*ptr)->getY1(), height - 1);
+        for (int y = y0; y <= y1; ++y) {
+            rowBadList[y].push_back(*ptr);
+        }
+    }
     /*
      * Go through the frame looking at each pixel (except the edge ones which we ignore)
      */
@@ -2097,7 +2110,10 @@ void interpolateOverDefects(MaskedImageT &mimage,                ///< Image to p
                   "the full interpolation not edge code");
 
     for (int y = 0; y != height; y++) {
-        std::vector<Defect::Ptr> badList1D = classify_defects(badList, y, width);
+        if (rowBadList[y].empty()) {
+            continue;
+        }
+        std::vector<Defect::Ptr> badList1D = classify_defects(rowBadList[y], y, width);
 
         do_defects(badList1D, y, *mimage.getImage(),
                    -std::numeric_limits<typename MaskedImageT::Image::Pixel>::max(), fallbackValue,
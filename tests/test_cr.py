@@ -19,7 +19,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import math
 import os
 import sys
 import unittest
@@ -29,6 +28,7 @@ import lsst.afw.image as afwImage
 import lsst.afw.math as afwMath
 import lsst.log.utils as logUtils
 import lsst.meas.algorithms as algorithms
+from lsst.meas.algorithms.installGaussianPsf import FwhmPerSigma
 import lsst.pex.config as pexConfig
 import lsst.utils
 import lsst.utils.tests
@@ -56,7 +56,7 @@ class CosmicRayTestCase(lsst.utils.tests.TestCase):
 
     def setUp(self):
         self.FWHM = 5                   # pixels
-        self.psf = algorithms.DoubleGaussianPsf(29, 29, self.FWHM/(2*math.sqrt(2*math.log(2))))
+        self.psf = algorithms.DoubleGaussianPsf(29, 29, self.FWHM/FwhmPerSigma)
 
         self.mi = afwImage.MaskedImageF(imageFile0)
         self.XY0 = lsst.geom.PointI(0, 0)  # origin of the subimage we use
@@ -170,7 +170,7 @@ class CosmicRayNullTestCase(unittest.TestCase):
         self.FWHM = 5                   # pixels
         self.size = 128
 
-        self.psf = algorithms.DoubleGaussianPsf(29, 29, self.FWHM/(2*math.sqrt(2*math.log(2))))
+        self.psf = algorithms.DoubleGaussianPsf(29, 29, self.FWHM/FwhmPerSigma)
         self.mi = afwImage.MaskedImageF(128, 128)
         self.mi.set((0, 0, 1))
 
@@ -19,7 +19,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import math
 import unittest
 import numpy as np
 
@@ -27,6 +26,7 @@ import lsst.geom
 import lsst.afw.image as afwImage
 import lsst.afw.math as afwMath
 import lsst.meas.algorithms as measAlg
+from lsst.meas.algorithms.installGaussianPsf import FwhmPerSigma
 import lsst.pex.exceptions as pexExceptions
 import lsst.utils.tests
 
@@ -47,7 +47,7 @@ class GaussianPsfTestCase(lsst.utils.tests.TestCase):
     def setUp(self):
         FWHM = 5
         self.ksize = 25                      # size of desired kernel
-        sigma = FWHM/(2*math.sqrt(2*math.log(2)))
+        sigma = FWHM/FwhmPerSigma
         self.psfDg = measAlg.DoubleGaussianPsf(self.ksize, self.ksize,
                                                sigma, 1, 0.1)
         self.psfSg = measAlg.SingleGaussianPsf(self.ksize, self.ksize, sigma)
@@ -21,12 +21,12 @@
 
 import os
 import unittest
-import math
 import numpy as np
 
 import lsst.geom
 import lsst.afw.image as afwImage
 import lsst.meas.algorithms as algorithms
+from lsst.meas.algorithms.installGaussianPsf import FwhmPerSigma
 import lsst.utils.tests
 from lsst.daf.base import PropertyList
 
@@ -161,7 +161,7 @@ class InterpolationTestCase(lsst.utils.tests.TestCase):
 
     def setUp(self):
         self.FWHM = 5
-        self.psf = algorithms.DoubleGaussianPsf(15, 15, self.FWHM/(2*math.sqrt(2*math.log(2))))
+        self.psf = algorithms.DoubleGaussianPsf(15, 15, self.FWHM/FwhmPerSigma)
         maskedImageFile = os.path.join(afwdataDir, "CFHT", "D4", "cal-53535-i-797722_1.fits")
 
         self.mi = afwImage.MaskedImageF(maskedImageFile)
@@ -222,13 +222,17 @@ class InterpolationTestCase(lsst.utils.tests.TestCase):
         mi = afwImage.makeMaskedImage(im)
         mi.set(100)
         flat = afwImage.ImageF(im.getDimensions())
-        flat.set(1)
-        flat[50:51, :, afwImage.LOCAL] = 0.0
-        flat[55:56, :, afwImage.LOCAL] = 0.0
-        flat[58:59, :, afwImage.LOCAL] = 0.0
-        flat[51:60, 51:, afwImage.LOCAL] = 0.0
-
-        mi /= flat
+        flata = flat.getArray()         # n.b. indexed [y, x]
+        flata[:] = 1.0
+        flata[:, [50, 55, 58]] = 0.0
+        flata[51:, 51:60] = 0.0
+
+        # Only the image plane needs flat-fielding; the zero-flat pixels become non-finite
+        # (which is what #1295 is about), and are flagged BAD as well
+        mia = mi.getImage().getArray()
+        with np.errstate(divide="ignore"):
+            np.divide(mia, flata, out=mia)
+        mi.getMask().getArray()[flata == 0] |= mi.getMask().getPlaneBitMask("BAD")
 
         if display:
             afwDisplay.Display(frame=0).mtv(mi, title=self._testMethodName + ": Raw")
@@ -243,7 +247,7 @@ class InterpolationTestCase(lsst.utils.tests.TestCase):
         bbox = lsst.geom.BoxI(lsst.geom.PointI(51, 51), lsst.geom.ExtentI(9, 49))
         defectList.append(algorithms.Defect(bbox))
 
-        psf = algorithms.DoubleGaussianPsf(15, 15, 1./(2*math.sqrt(2*math.log(2))))
+        psf = algorithms.DoubleGaussianPsf(15, 15, 1./FwhmPerSigma)
         algorithms.interpolateOverDefects(mi, psf, defectList, 50.)
 
         if display:
@@ -335,7 +339,7 @@ class InterpolationTestCase(lsst.utils.tests.TestCase):
             if display:
                 afwDisplay.Display(frame=2).mtv(mi, title=self._testMethodName + ": image")
 
-            psf = algorithms.DoubleGaussianPsf(15, 15, 1./(2*math.sqrt(2*math.log(2))))
+            psf = algorithms.DoubleGaussianPsf(15, 15, 1./FwhmPerSigma)
             algorithms.interpolateOverDefects(mi, psf, defectList, 0, True)
 
             if display:
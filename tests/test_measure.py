@@ -31,6 +31,7 @@ import lsst.afw.table as afwTable
 from lsst.log import Log
 import lsst.meas.base as measBase
 import lsst.meas.algorithms as algorithms
+from lsst.meas.algorithms.installGaussianPsf import FwhmPerSigma
 import lsst.pex.config as pexConfig
 import lsst.utils.tests
 
@@ -73,8 +74,7 @@ class MeasureTestCase(lsst.utils.tests.TestCase):
             """Insert self into an image"""
             for sp in self.spans:
                 y, x0, x1 = sp
-                for x in range(x0, x1 + 1):
-                    im[x + dx, y + dy, afwImage.LOCAL] = self.val
+                im.array[y + dy, x0 + dx:x1 + dx + 1] = self.val
 
         def __eq__(self, other):
             for osp, sp in zip(other.getSpans(), self.spans):
@@ -182,7 +182,7 @@ class FindAndMeasureTestCase(lsst.utils.tests.TestCase):
                                                      "CFHT", "D4", "cal-53535-i-797722_1.fits"))
 
         self.FWHM = 5
-        self.psf = algorithms.DoubleGaussianPsf(15, 15, self.FWHM/(2*math.sqrt(2*math.log(2))))
+        self.psf = algorithms.DoubleGaussianPsf(15, 15, self.FWHM/FwhmPerSigma)
 
         if False:                       # use full image, trimmed to data section
             self.XY0 = lsst.geom.PointI(32, 2)
@@ -240,33 +240,30 @@ class FindAndMeasureTestCase(lsst.utils.tests.TestCase):
         # We do a pretty good job of interpolating, so don't propagagate the convolved CR/INTRP bits
         # (we'll keep them for the original CR/INTRP pixels)
         #
-        savedMask = self.mi.getMask().Factory(self.mi.getMask(), True)
-        saveBits = savedMask.getPlaneBitMask("CR") | \
-            savedMask.getPlaneBitMask("BAD") | \
-            savedMask.getPlaneBitMask("INTRP")  # Bits to not convolve
-        savedMask &= saveBits
-
-        msk = self.mi.getMask()
-        msk &= ~saveBits  # Clear the saved bits
-        del msk
+        mska = self.mi.getMask().getArray()
+        saveBits = self.mi.mask.getPlaneBitMask(["CR", "BAD", "INTRP"])  # Bits to not convolve
+        savedBits = mska & saveBits
+        mska &= ~saveBits  # Clear the saved bits
         #
         # Smooth image
         #
-        psf = algorithms.DoubleGaussianPsf(15, 15, self.FWHM/(2*math.sqrt(2*math.log(2))))
+        # The smoothing PSF is a single Gaussian, so use the equivalent separable
+        # kernel: two 1-d passes are much cheaper than a 2-d convolution
+        gaussFunc = afwMath.GaussianFunction1D(self.FWHM/FwhmPerSigma)
+        kernel = afwMath.SeparableKernel(15, 15, gaussFunc, gaussFunc)
 
         cnvImage = self.mi.Factory(self.mi.getBBox())
-        kernel = psf.getKernel()
         afwMath.convolve(cnvImage, self.mi, kernel, afwMath.ConvolutionControl())
 
-        msk = cnvImage.getMask()
-        msk |= savedMask  # restore the saved bits
-        del msk
+        cnvMska = cnvImage.getMask().getArray()
+        cnvMska |= savedBits  # restore the saved bits
+        del savedBits
 
         threshold = afwDetection.Threshold(3, afwDetection.Threshold.STDEV)
         #
         # Only search the part of the frame that was PSF-smoothed
         #
-        llc = lsst.geom.PointI(psf.getKernel().getWidth()//2, psf.getKernel().getHeight()//2)
+        llc = lsst.geom.PointI(kernel.getWidth()//2, kernel.getHeight()//2)
         urc = lsst.geom.PointI(cnvImage.getWidth() - llc[0] - 1, cnvImage.getHeight() - llc[1] - 1)
         middle = cnvImage.Factory(cnvImage, lsst.geom.BoxI(llc, urc), afwImage.LOCAL)
         ds = afwDetection.FootprintSet(middle, threshold, "DETECTED")
@@ -274,11 +271,8 @@ class FindAndMeasureTestCase(lsst.utils.tests.TestCase):
         #
         # Reinstate the saved (e.g. BAD) (and also the DETECTED | EDGE) bits in the unsmoothed image
         #
-        savedMask[:] = cnvImage.getMask()
-        msk = self.mi.getMask()
-        msk |= savedMask
-        del msk
-        del savedMask
+        mska |= cnvMska
+        del mska, cnvMska
 
         if display:
             disp = afwDisplay.Display(frame=2)
@@ -323,7 +317,7 @@ class GaussianPsfTestCase(lsst.utils.tests.TestCase):
 
     def setUp(self):
         FWHM = 5
-        psf = algorithms.DoubleGaussianPsf(15, 15, FWHM/(2*math.sqrt(2*math.log(2))))
+        psf = algorithms.DoubleGaussianPsf(15, 15, FWHM/FwhmPerSigma)
         mi = afwImage.MaskedImageF(lsst.geom.ExtentI(100, 100))
 
         self.xc, self.yc, self.instFlux = 45, 55, 1000.0
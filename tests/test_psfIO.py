@@ -20,12 +20,9 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
-import math
 import unittest
 import tempfile
 
-import numpy as np
-
 import lsst.utils.tests
 import lsst.geom
 import lsst.afw.image as afwImage
@@ -35,6 +32,7 @@ import lsst.afw.table as afwTable
 from lsst.log import Log
 import lsst.meas.base as measBase
 import lsst.meas.algorithms as algorithms
+from lsst.meas.algorithms.installGaussianPsf import FwhmPerSigma
 
 try:
     type(display)
@@ -72,7 +70,7 @@ class SpatialModelPsfTestCase(lsst.utils.tests.TestCase):
         self.exposure = afwImage.makeExposure(self.mi)
 
         psf = roundTripPsf(2, algorithms.DoubleGaussianPsf(self.ksize, self.ksize,
-                                                           self.FWHM/(2*math.sqrt(2*math.log(2))), 1, 0.1))
+                                                           self.FWHM/FwhmPerSigma, 1, 0.1))
         self.exposure.setPsf(psf)
 
         for x, y in [(20, 20),
@@ -99,7 +97,7 @@ class SpatialModelPsfTestCase(lsst.utils.tests.TestCase):
             del smi
 
         roundTripPsf(4, algorithms.DoubleGaussianPsf(self.ksize, self.ksize,
-                                                     self.FWHM/(2*math.sqrt(2*math.log(2))), 1, 0.1))
+                                                     self.FWHM/FwhmPerSigma, 1, 0.1))
 
         self.cellSet = afwMath.SpatialCellSet(lsst.geom.BoxI(lsst.geom.PointI(0, 0),
                                                              lsst.geom.ExtentI(width, height)), 100)
@@ -356,7 +354,7 @@ class DoubleGaussianPsfTestCase(unittest.TestCase):
     def setUp(self):
         self.ksize = 25                      # size of desired kernel
         FWHM = 5
-        self.sigma1 = FWHM/(2*np.sqrt(2*np.log(2)))
+        self.sigma1 = FWHM/FwhmPerSigma
         self.sigma2 = 2*self.sigma1
         self.b = 0.1
 
@@ -47,20 +47,44 @@ else:
     afwDisplay.setDefaultMaskTransparency(75)
 
 
-def plantSources(x0, y0, nx, ny, sky, nObj, wid, detector, useRandom=False):
+def clipStamp(start, size, n):
+    """Clip a 1-d stamp of ``size`` pixels, starting at pixel ``start``, to an image of ``n`` pixels
+
+    Returns the slice of the image and the matching slice of the stamp, and whether the
+    stamp lies entirely within the image.
+    """
+    begin, end = max(start, 0), max(min(start + size, n), 0)
+    begin = min(begin, end)
+    return slice(begin, end), slice(begin - start, end - start), (begin == start and end == start + size)
+
+
+def plantSources(x0, y0, nx, ny, sky, nObj, wid, detector, useRandom=False, rng=None):
+    """Make noisy exposures of Gaussian stars, with and without the detector's distortion
+
+    Returns the distorted exposure, the positions of the stars that lie wholly on it, and the
+    same for the undistorted exposure.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
 
     pixToTanPix = detector.getTransform(cameraGeom.PIXELS, cameraGeom.TAN_PIXELS)
 
     img0 = afwImage.ImageF(lsst.geom.ExtentI(nx, ny))
     img = afwImage.ImageF(lsst.geom.ExtentI(nx, ny))
+    img0Arr, imgArr = img0.getArray(), img.getArray()  # n.b. indexed [y, x]
 
     ixx0, iyy0, ixy0 = wid*wid, wid*wid, 0.0
 
     edgeBuffer = 40.0*wid
 
     flux = 1.0e4
+    I00 = flux/(2*math.pi*wid*wid)  # peak of the undistorted Gaussian
+    invWid2 = 1.0/(wid*wid)
     nkx, nky = int(10*wid) + 1, int(10*wid) + 1
     xhwid, yhwid = nkx//2, nky//2
+    xoff, yoff = np.arange(nkx) - xhwid, np.arange(nky) - yhwid
+    # offsets of each stamp pixel from the stamp's central pixel; the same for all objects
+    xoffGrid, yoffGrid = np.meshgrid(xoff, yoff)
 
     nRow = int(math.sqrt(nObj))
     xstep = (nx - 1 - 0.0*edgeBuffer)//(nRow+1)
@@ -76,7 +100,7 @@ def plantSources(x0, y0, nx, ny, sky, nObj, wid, detector, useRandom=False):
 
         # get our position
         if useRandom:
-            xcen0, ycen0 = np.random.uniform(nx), np.random.uniform(ny)
+            xcen0, ycen0 = rng.uniform(0, nx), rng.uniform(0, ny)
         else:
             xcen0, ycen0 = xstep*((i % nRow) + 1), ystep*(int(i/nRow) + 1)
         ixcen0, iycen0 = int(xcen0), int(ycen0)
@@ -97,46 +121,36 @@ def plantSources(x0, y0, nx, ny, sky, nObj, wid, detector, useRandom=False):
 
         # plant the object
         tmp = 0.25*(ixx-iyy)**2 + ixy**2
-        a2 = 0.5*(ixx+iyy) + np.sqrt(tmp)
-        b2 = 0.5*(ixx+iyy) - np.sqrt(tmp)
+        a2 = 0.5*(ixx+iyy) + math.sqrt(tmp)
+        b2 = 0.5*(ixx+iyy) - math.sqrt(tmp)
 
-        theta = 0.5*np.arctan2(2.0*ixy, ixx-iyy)
-        a = np.sqrt(a2)
-        b = np.sqrt(b2)
+        theta = 0.5*math.atan2(2.0*ixy, ixx-iyy)
+        a = math.sqrt(a2)
+        b = math.sqrt(b2)
+        I0 = flux/(2*math.pi*a*b)
+        invA2, invB2 = 1.0/a2, 1.0/b2
 
         c, s = math.cos(theta), math.sin(theta)
-        good0, good = True, True
-        for y in range(nky):
-            iy = iycen + y - yhwid
-            iy0 = iycen0 + y - yhwid
-
-            for x in range(nkx):
-                ix = ixcen + x - xhwid
-                ix0 = ixcen0 + x - xhwid
-
-                if ix >= 0 and ix < nx and iy >= 0 and iy < ny:
-                    dx, dy = ix - xcen, iy - ycen
-                    u = c*dx + s*dy
-                    v = -s*dx + c*dy
-                    I0 = flux/(2*math.pi*a*b)
-                    val = I0*math.exp(-0.5*((u/a)**2 + (v/b)**2))
-                    if val < 0:
-                        val = 0
-                    prevVal = img[ix, iy, afwImage.LOCAL]
-                    img[ix, iy, afwImage.LOCAL] = val+prevVal
-                else:
-                    good = False
-
-                if ix0 >= 0 and ix0 < nx and iy0 >= 0 and iy0 < ny:
-                    dx, dy = ix - xcen, iy - ycen
-                    I0 = flux/(2*math.pi*wid*wid)
-                    val = I0*math.exp(-0.5*((dx/wid)**2 + (dy/wid)**2))
-                    if val < 0:
-                        val = 0
-                    prevVal = img0[ix0, iy0, afwImage.LOCAL]
-                    img0[ix0, iy0, afwImage.LOCAL] = val+prevVal
-                else:
-                    good0 = False
+
+        # the parts of the image and of the stamps where the stamps land on the image
+        xImg, xStamp, xGood = clipStamp(ixcen - xhwid, nkx, nx)
+        yImg, yStamp, yGood = clipStamp(iycen - yhwid, nky, ny)
+        xImg0, xStamp0, xGood0 = clipStamp(ixcen0 - xhwid, nkx, nx)
+        yImg0, yStamp0, yGood0 = clipStamp(iycen0 - yhwid, nky, ny)
+        good = xGood and yGood
+        good0 = xGood0 and yGood0
+
+        # Both stamps are evaluated on the same grid of offsets from the object's centre;
+        # the undistorted one is circular, so only needs the radius
+        dx, dy = xoffGrid + (ixcen - xcen), yoffGrid + (iycen - ycen)
+        u = c*dx + s*dy
+        v = -s*dx + c*dy
+        val = I0*np.exp(-0.5*(u*u*invA2 + v*v*invB2))
+        val0 = I00*np.exp(-0.5*(dx*dx + dy*dy)*invWid2)
+
+        # stamps are rectangular, so overlapping stars sum correctly without np.add.at
+        imgArr[yImg, xImg] += val[yStamp, xStamp]
+        img0Arr[yImg0, xImg0] += val0[yStamp0, xStamp0]
 
         if good0:
             goodAdded0.append([xcen, ycen])
@@ -144,33 +158,27 @@ def plantSources(x0, y0, nx, ny, sky, nObj, wid, detector, useRandom=False):
             goodAdded.append([xcen, ycen])
 
     # add sky and noise
-    img += sky
-    img0 += sky
+    imgArr += sky
+    img0Arr += sky
     noise = afwImage.ImageF(lsst.geom.ExtentI(nx, ny))
     noise0 = afwImage.ImageF(lsst.geom.ExtentI(nx, ny))
-    for i in range(nx):
-        for j in range(ny):
-            noise[i, j, afwImage.LOCAL] = np.random.poisson(img[i, j, afwImage.LOCAL])
-            noise0[i, j, afwImage.LOCAL] = np.random.poisson(img0[i, j, afwImage.LOCAL])
+    noise.getArray()[:] = rng.poisson(imgArr)
+    noise0.getArray()[:] = rng.poisson(img0Arr)
 
     edgeWidth = int(0.5*edgeBuffer)
     mask = afwImage.Mask(lsst.geom.ExtentI(nx, ny))
-    left = lsst.geom.Box2I(lsst.geom.Point2I(0, 0), lsst.geom.ExtentI(edgeWidth, ny))
-    right = lsst.geom.Box2I(lsst.geom.Point2I(nx - edgeWidth, 0), lsst.geom.ExtentI(edgeWidth, ny))
-    top = lsst.geom.Box2I(lsst.geom.Point2I(0, ny - edgeWidth), lsst.geom.ExtentI(nx, edgeWidth))
-    bottom = lsst.geom.Box2I(lsst.geom.Point2I(0, 0), lsst.geom.ExtentI(nx, edgeWidth))
-
-    for pos in [left, right, top, bottom]:
-        msk = afwImage.Mask(mask, pos, deep=False)
-        msk.set(msk.getPlaneBitMask('EDGE'))
+    maskArr = mask.getArray()
+    edgeBit = mask.getPlaneBitMask('EDGE')
+    maskArr[:, :edgeWidth] = edgeBit       # left
+    maskArr[:, nx - edgeWidth:] = edgeBit  # right
+    maskArr[ny - edgeWidth:, :] = edgeBit  # top
+    maskArr[:edgeWidth, :] = edgeBit       # bottom
 
     expos = afwImage.makeExposure(afwImage.makeMaskedImage(noise, mask, afwImage.ImageF(noise, True)))
     expos0 = afwImage.makeExposure(afwImage.makeMaskedImage(noise0, mask, afwImage.ImageF(noise0, True)))
 
-    im = expos.getMaskedImage().getImage()
-    im0 = expos0.getMaskedImage().getImage()
-    im -= sky
-    im0 -= sky
+    expos.getMaskedImage().getImage().getArray()[:] -= sky
+    expos0.getMaskedImage().getImage().getArray()[:] -= sky
 
     return expos, goodAdded, expos0, goodAdded0
 
@@ -179,7 +187,7 @@ class PsfSelectionTestCase(lsst.utils.tests.TestCase):
     """Test the aperture correction."""
 
     def setUp(self):
-        np.random.seed(500)  # make test repeatable
+        self.rng = np.random.default_rng(500)  # make test repeatable
         self.x0, self.y0 = 0, 0
         self.nx, self.ny = 512, 512  # 2048, 4096
         self.sky = 100.0
@@ -278,7 +286,8 @@ class PsfSelectionTestCase(lsst.utils.tests.TestCase):
         psfSigma = 1.5
         exposDist, nGoodDist, expos0, nGood0 = plantSources(self.x0, self.y0,
                                                             self.nx, self.ny,
-                                                            self.sky, self.nObj, psfSigma, detector)
+                                                            self.sky, self.nObj, psfSigma, detector,
+                                                            rng=self.rng)
 
         # set the psf
         kwid = 21
@@ -367,11 +376,13 @@ class PsfSelectionTestCase(lsst.utils.tests.TestCase):
         detector = self.detector
 
         psfSigma = 1.5
-        stars = plantSources(self.x0, self.y0, self.nx, self.ny, self.sky, self.nObj, psfSigma, detector)
+        stars = plantSources(self.x0, self.y0, self.nx, self.ny, self.sky, self.nObj, psfSigma, detector,
+                             rng=self.rng)
         expos, starXy = stars[0], stars[1]
 
         # add some faint round galaxies ... only slightly bigger than the psf
-        gxy = plantSources(self.x0, self.y0, self.nx, self.ny, self.sky, 10, 1.07*psfSigma, detector)
+        gxy = plantSources(self.x0, self.y0, self.nx, self.ny, self.sky, 10, 1.07*psfSigma, detector,
+                           rng=self.rng)
         mi = expos.getMaskedImage()
         mi += gxy[0].getMaskedImage()
         gxyXy = gxy[1]